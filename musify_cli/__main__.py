@@ -40,11 +40,17 @@ def setup() -> tuple[MusifyConfig, dict[str, MusifyConfig]]:
     base.logging.configure_logging()
 
     # clean up app data backup folder using the same logic for all file handlers
+    backup_path = base.paths.backup
+    policies = set()  # rotating again with the same policy has no effect, only rotate once per unique policy
     for name in logging.getHandlerNames():
         handler = logging.getHandlerByName(name)
-        if isinstance(handler, CurrentTimeRotatingFileHandler):
-            backup_path = base.paths.backup
-            handler.rotator(str(backup_path.joinpath("{}")), backup_path)
+        if not isinstance(handler, CurrentTimeRotatingFileHandler):
+            continue
+        if (policy := (handler.dt, handler.delta, handler.count)) in policies:
+            continue
+
+        policies.add(policy)
+        handler.rotator(str(backup_path.joinpath("{}")), backup_path)
 
     return base, functions
 
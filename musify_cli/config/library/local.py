@@ -3,6 +3,7 @@ Config objects relating to local library operations.
 """
 import sys
 from abc import ABCMeta, abstractmethod
+from itertools import chain
 from pathlib import Path, PureWindowsPath, PurePosixPath, PurePath
 from typing import Self, ClassVar, Annotated
 
@@ -207,8 +208,9 @@ class UpdaterConfig(Runner[dict[LocalTrack, SyncResultTrack]]):
         if isinstance(collection, LocalCollection):
             item_log = f"{len(collection)} tracks"
         else:  # flatten many collections to one
-            item_log = f"{sum(len(coll) for coll in collection)} tracks in {len(collection)} collections"
-            collection = BasicLocalCollection(name="saver", tracks=[track for coll in collection for track in coll])
+            tracks = list(chain.from_iterable(collection))
+            item_log = f"{len(tracks)} tracks in {len(collection)} collections"
+            collection = BasicLocalCollection(name="saver", tracks=tracks)
 
         self._logger.info(
             f"\33[1;95m ->\33[1;97m Updating tags for {item_log}: "
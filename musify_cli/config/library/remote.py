@@ -1,17 +1,19 @@
 """
 Config objects relating to remote library operations.
 """
+import logging
+import re
 from abc import ABCMeta, abstractmethod
-from collections.abc import Collection
-from copy import copy
+from collections.abc import Collection, Iterable
 from datetime import timedelta, date, datetime
+from itertools import chain
 from pathlib import Path
 from typing import Literal, ClassVar
 
 from aiorequestful.cache.backend import ResponseCache, SQLiteCache, CACHE_TYPES, CACHE_CLASSES
 from aiorequestful.timer import GeometricCountTimer, StepCeilingTimer
 from aiorequestful.types import UnitSequence
-from musify.libraries.core.object import Playlist
+from musify.libraries.core.object import Playlist, Track
 from musify.libraries.remote.core.api import RemoteAPI
 from musify.libraries.remote.core.factory import RemoteObjectFactory
 from musify.libraries.remote.core.library import RemoteLibrary
@@ -97,11 +99,11 @@ class RemoteNewMusicConfig(Runner[tuple[RemotePlaylist, SyncResultRemotePlaylist
     )
     start: date = Field(
         description="The earliest date to get new music for.",
-        default=(datetime.now() - timedelta(weeks=4)).date(),
+        default_factory=lambda: (datetime.now() - timedelta(weeks=4)).date(),
     )
     end: date = Field(
         description="The latest date to get new music for.",
-        default=datetime.now().date(),
+        default_factory=date.today,
     )
 
     async def run(
@@ -115,10 +117,8 @@ class RemoteNewMusicConfig(Runner[tuple[RemotePlaylist, SyncResultRemotePlaylist
         :return: The name of the new playlist and results of the sync as a :py:class:`SyncResultRemotePlaylist` object.
         """
         albums = self._filter_artist_albums_by_date(library)
-        tracks = [
-            track for album in sorted(albums, key=lambda x: (x.year, x.month or 1, x.day or 1), reverse=True)
-            for track in album
-        ]
+        albums.sort(key=lambda x: (x.year, x.month or 1, x.day or 1), reverse=True)
+        tracks = self._remove_duplicate_tracks(chain.from_iterable(albums))
 
         self._logger.info(
             f"\33[1;95m  >\33[1;97m Creating {self.name!r} {library.source} playlist "
@@ -130,22 +130,51 @@ class RemoteNewMusicConfig(Runner[tuple[RemotePlaylist, SyncResultRemotePlaylist
         response = await library.api.get_or_create_playlist(self.name)
         pl: RemotePlaylist = library.factory.playlist(response, skip_checks=True)
         pl.clear()
-        pl.extend(tracks, allow_duplicates=False)
+        pl.extend(tracks)
         return pl, await pl.sync(kind="refresh", reload=False, dry_run=dry_run)
 
+    @staticmethod
+    def _remove_duplicate_tracks[T: Track](tracks: Iterable[T]) -> list[T]:
+        """
+        Returns the given ``tracks`` keeping only the first of any tracks which are equal to each other.
+
+        Matches tracks in the same way as :py:class:`Track` equality i.e. on URI or on title, album and
+        any shared artist, but looks up previously kept tracks by these values instead of comparing
+        every track against every other track.
+        """
+        unique = []
+        uris = set()
+        artists_seen: dict[tuple[str | None, str | None], list[set[str]]] = {}
+
+        for track in tracks:
+            if track.has_uri and track.uri in uris:
+                continue
+
+            artists = {artist if isinstance(artist, str) else artist.name for artist in track.artists}
+            artists_seen_for_track = artists_seen.setdefault((track.title, track.album), [])
+            if any(artists & seen for seen in artists_seen_for_track):
+                continue
+
+            unique.append(track)
+            if track.has_uri:
+                uris.add(track.uri)
+            artists_seen_for_track.append(artists)
+
+        return unique
+
+    def match_date(self, album: RemoteAlbum) -> bool:
+        """Match start and end dates to the release date of the given ``album``"""
+        if album.date:
+            return self.start <= album.date <= self.end
+        if album.month:
+            return self.start.year <= album.year <= self.end.year and self.start.month <= album.month <= self.end.month
+        if album.year:
+            return self.start.year <= album.year <= self.end.year
+        return False
+
     def _filter_artist_albums_by_date(self, library: RemoteLibrary) -> list[RemoteAlbum]:
         """Returns all loaded artist albums that are within the given ``start`` and ``end`` dates inclusive"""
-        def match_date(alb: RemoteAlbum) -> bool:
-            """Match start and end dates to the release date of the given ``alb``"""
-            if alb.date:
-                return self.start <= alb.date <= self.end
-            if alb.month:
-                return self.start.year <= alb.year <= self.end.year and self.start.month <= alb.month <= self.end.month
-            if alb.year:
-                return self.start.year <= alb.year <= self.end.year
-            return False
-
-        return list(filter(match_date, (album for artist in library.artists for album in artist.albums)))
+        return list(filter(self.match_date, (album for artist in library.artists for album in artist.albums)))
 
 
 ###########################################################################
@@ -326,23 +355,22 @@ class RemotePlaylistsSync(Runner[dict[str, SyncResultRemotePlaylist]]):
         :param dry_run: Run function, but do not modify the library's playlists at all.
         :return: Map of playlist name to the results of the sync as a :py:class:`SyncResultRemotePlaylist` object.
         """
-        playlists = list(map(copy, playlists))
-        for pl in playlists:  # so filter_playlists doesn't clear the list of tracks on the original playlist objects
-            pl._tracks = pl.tracks.copy()
-
+        # sync from a map of playlist name to filtered tracks so the original playlist objects are never modified
+        filtered = dict(zip((pl.name for pl in playlists), self._filter_tracks(playlists=playlists)))
         return await library.sync(
-            playlists=self._filter_playlists(playlists=playlists),
+            playlists=filtered,
             kind=self.kind,
             reload=self.reload,
             dry_run=dry_run,
         )
 
-    def _filter_playlists[T: Playlist](self, playlists: Collection[T]) -> Collection[T]:
+    def _filter_tracks[T: Track](self, playlists: Collection[Playlist[T]]) -> list[list[T]]:
         """
-        Returns a filtered set of the given ``playlists`` according to the config for this library.
+        Returns the tracks of each of the given ``playlists`` which are not filtered out
+        according to the config for this library. Does not modify the given ``playlists``.
 
         :param playlists: The playlists to be filtered.
-        :return: Filtered playlists.
+        :return: The filtered tracks of each playlist in the same order as the given ``playlists``.
         """
         tag_filter = self.filter
         self._logger.info(
@@ -350,32 +378,36 @@ class RemotePlaylistsSync(Runner[dict[str, SyncResultRemotePlaylist]]):
             f"\33[0;90m    Filter out tags: {tag_filter} \33[0m"
         )
 
-        max_width = get_max_width([pl.name for pl in playlists])
-        for pl in playlists:
-            initial_count = len(pl)
-            tracks = []
-            for track in pl.tracks:
-                keep = True
-
-                for tag, values in tag_filter.items():
-                    item_val = str(track[tag])
-
-                    if any(v.strip().casefold() in item_val.strip().casefold() for v in values):
-                        keep = False
-                        break
+        # match any of the values for each tag in a single scan, tags with no values can never match
+        patterns = {
+            tag: re.compile("|".join(re.escape(v.strip().casefold()) for v in values))
+            for tag, values in tag_filter.items() if values
+        }
+        if not patterns:  # nothing can be filtered out, skip checking every track
+            self._logger.print_line()
+            return [list(pl.tracks) for pl in playlists]
 
-                if keep:
-                    tracks.append(track)
+        # only pay for aligning and formatting the per-playlist log lines when they will actually be logged
+        log_debug = self._logger.isEnabledFor(logging.DEBUG)
+        max_width = get_max_width([pl.name for pl in playlists]) if log_debug else 0
 
-            pl.clear()
-            pl.extend(tracks)
-
-            self._logger.debug(
-                f"{align_string(pl.name, max_width=max_width)} | Filtered out {initial_count - len(pl):>3} items"
-            )
+        filtered = []
+        for pl in playlists:
+            tracks = [
+                track for track in pl.tracks
+                if not any(
+                    pattern.search(str(track[tag]).strip().casefold()) for tag, pattern in patterns.items()
+                )
+            ]
+            filtered.append(tracks)
+
+            if log_debug:
+                self._logger.debug(
+                    f"{align_string(pl.name, max_width=max_width)} | Filtered out {len(pl) - len(tracks):>3} items"
+                )
 
         self._logger.print_line()
-        return playlists
+        return filtered
 
 
 class RemotePlaylistsConfig(PlaylistsConfig):
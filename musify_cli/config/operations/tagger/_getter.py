@@ -3,6 +3,7 @@ Handles getting of tag values from items based on a set of configurable rules.
 """
 from abc import ABCMeta, abstractmethod
 from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any, Self
 
 from musify.base import MusifyItem
@@ -16,6 +17,12 @@ from musify_cli.config.operations.filters import get_comparers_filter
 from musify_cli.exception import ParserError
 
 
+@lru_cache(maxsize=None)
+def _tag_field_from_name(name: str) -> TagField:
+    """Get the first :py:class:`TagField` matching the given ``name``, caching the result for repeated names"""
+    return next(iter(TagFields.from_name(name)))
+
+
 class Getter(PrettyPrinter, metaclass=ABCMeta):
     @classmethod
     @abstractmethod
@@ -39,15 +46,14 @@ class TagGetter(Getter):
     @classmethod
     def from_field(cls, field: str) -> Self:
         """Create a new instance of this Getter type from the given ``field``"""
-        field = next(iter(TagFields.from_name(field)))
-        return cls(field)
+        return cls(_tag_field_from_name(field))
 
     @classmethod
     def from_dict(cls, config: Mapping[str, Any]):
         if "field" not in config:
             raise ParserError("No field given", value=config)
 
-        field = next(iter(TagFields.from_name(config["field"])))
+        field = _tag_field_from_name(config["field"])
         leading_zeros = cls._get_leading_zeros_from_config(config)
         return cls(field, leading_zeros=leading_zeros)
 
@@ -55,7 +61,7 @@ class TagGetter(Getter):
     def _get_leading_zeros_from_config(cls, config: Mapping[str, Any]) -> int | TagField | None:
         if isinstance(leading_zeros := config.get("leading_zeros"), int) or leading_zeros is None:
             return leading_zeros
-        return TagFields.from_name(leading_zeros)[0]
+        return _tag_field_from_name(leading_zeros)
 
     def __init__(self, field: TagField | None, leading_zeros: int | TagField = None):
         super().__init__(field)
@@ -68,12 +74,12 @@ class TagGetter(Getter):
         else:
             width = self.leading_zeros
 
-        return value.zfill(width)
+        return value.zfill(width) if width > len(value) else value
 
     def get[T: MusifyItem](self, item: T) -> Any:
         value = item[self.field] if self.field is not None else None
         if value is not None and self.leading_zeros is not None:
-            value = self._add_leading_zeros(item, str(value))
+            value = self._add_leading_zeros(item, value if isinstance(value, str) else str(value))
         return value
 
     def as_dict(self):
@@ -87,7 +93,7 @@ class ConditionalGetter(TagGetter):
         filter_ = get_comparers_filter(when)
 
         field_str = config.get("field")
-        field = next(iter(TagFields.from_name(field_str))) if field_str else None
+        field = _tag_field_from_name(field_str) if field_str else None
 
         value = config.get("value", "")
         leading_zeros = cls._get_leading_zeros_from_config(config)
@@ -135,6 +141,7 @@ class PathGetter(Getter):
 
 
 GETTERS: list[type[Getter]] = [PathGetter]
+_GETTERS_MAP: dict[str, type[Getter]] = {cls.__name__.replace("Getter", "").lower(): cls for cls in GETTERS}
 
 
 def getter_from_config(config: str | Mapping[str, Any]) -> Getter:
@@ -142,10 +149,6 @@ def getter_from_config(config: str | Mapping[str, Any]) -> Getter:
     if not isinstance(config, Mapping):
         return TagGetter.from_field(config)
 
-    getters_map: dict[str, type[Getter]] = {
-        cls.__name__.replace("Getter", "").lower(): cls for cls in GETTERS
-    }
-
     if "when" in config:
         return ConditionalGetter.from_dict(config)
-    return getters_map.get(config.get("field"), TagGetter).from_dict(config)
+    return _GETTERS_MAP.get(config.get("field"), TagGetter).from_dict(config)
@@ -1,9 +1,11 @@
 """
 Handles setting of tag values from items based on a set of configurable rules.
 """
+import re
 from abc import ABCMeta, abstractmethod
-from collections.abc import Mapping, Sequence, Iterable
-from string import Formatter
+from collections import defaultdict
+from collections.abc import Mapping, Sequence, Iterable, Callable
+from functools import lru_cache
 from typing import Any, Self
 
 from aiorequestful.types import UnitCollection
@@ -20,6 +22,18 @@ from musify_cli.config.operations.tagger._getter import Getter, getter_from_conf
 from musify_cli.exception import ParserError
 
 
+@lru_cache(maxsize=None)
+def _local_tag_from_name(name: str) -> Tag:
+    """Get the first :py:class:`Tag` matching the given ``name``, caching the result for repeated names"""
+    return next(iter(Tag.from_name(name)))
+
+
+@lru_cache(maxsize=None)
+def _local_tags_from_names(names: tuple[str, ...]) -> tuple[Tag, ...]:
+    """Get all :py:class:`Tag` enums matching the given ``names``, caching the result for repeated names"""
+    return tuple(Tag.from_name(*names))
+
+
 class Setter(PrettyPrinter, metaclass=ABCMeta):
     @classmethod
     @abstractmethod
@@ -39,9 +53,38 @@ class Setter(PrettyPrinter, metaclass=ABCMeta):
     def _condition_is_valid(self, item: LocalTrack) -> bool:
         return len(self.condition.process([item])) > 0
 
-    @abstractmethod
+    def _filter_valid[T: LocalTrack](self, items: Iterable[T]) -> list[T]:
+        """Returns the ``items`` which meet the condition of this setter, processing all ``items`` in one call"""
+        items = list(items)
+        if not items or not self.condition.ready:
+            return items
+
+        valid = {id(item) for item in self.condition.process(items)}
+        return [item for item in items if id(item) in valid]
+
     def set[T: LocalTrack](self, item: T, collection: Iterable[T]) -> None:
-        """Set the value for the given ``item`` found within a given ``collection``"""
+        """
+        Set the value for the given ``item`` found within a given ``collection``.
+
+        :param item: The item to set a value for.
+        :param collection: The collection the given item belongs to.
+        """
+        if self._condition_is_valid(item):
+            self._set(item, collection)
+
+    def set_batch[T: LocalTrack](self, items: Iterable[T], collection: Iterable[T]) -> None:
+        """
+        Set the values for all the given ``items`` found within the same given ``collection``.
+
+        :param items: The items to set values for.
+        :param collection: The collection all the given items belong to.
+        """
+        for item in self._filter_valid(items):
+            self._set(item, collection)
+
+    @abstractmethod
+    def _set[T: LocalTrack](self, item: T, collection: Iterable[T]) -> None:
+        """Set the value for the given ``item`` found within a given ``collection`` without checking the condition"""
         raise NotImplementedError
 
     def as_dict(self):
@@ -60,9 +103,7 @@ class Value(Setter):
         super().__init__(field, condition=condition)
         self.value = value
 
-    def set[T: LocalTrack](self, item: T, collection: Iterable[T]):
-        if not self._condition_is_valid(item):
-            return
+    def _set[T: LocalTrack](self, item: T, collection: Iterable[T]):
         item[self.field] = self.value
 
     def as_dict(self):
@@ -75,7 +116,7 @@ class Field(Setter):
         if "field" not in config:
             raise ParserError("No value given", value=config)
 
-        value_of_field = next(iter(Tag.from_name(config["field"])))
+        value_of_field = _local_tag_from_name(config["field"])
         condition = cls._get_condition_from_dict(config)
         return cls(field=field, value_of=value_of_field, condition=condition)
 
@@ -83,9 +124,7 @@ class Field(Setter):
         super().__init__(field, condition=condition)
         self.value_of = value_of
 
-    def set[T: LocalTrack](self, item: T, collection: Iterable[T]):
-        if not self._condition_is_valid(item):
-            return
+    def _set[T: LocalTrack](self, item: T, collection: Iterable[T]):
         item[self.field] = item[self.value_of]
 
     def as_dict(self):
@@ -99,9 +138,7 @@ class Clear(Setter):
         condition = cls._get_condition_from_dict(config)
         return cls(field=field, condition=condition)
 
-    def set[T: LocalTrack](self, item: T, collection: Iterable[T]):
-        if not self._condition_is_valid(item):
-            return
+    def _set[T: LocalTrack](self, item: T, collection: Iterable[T]):
         item[self.field] = None
 
 
@@ -118,10 +155,7 @@ class Join(Setter):
         self.fields = fields
         self.separator = separator
 
-    def set[T: LocalTrack](self, item: T, collection: Iterable[T]):
-        if not self._condition_is_valid(item):
-            return
-
+    def _set[T: LocalTrack](self, item: T, collection: Iterable[T]):
         values = [getter.get(item) for getter in self.fields]
         item[self.field] = self.separator.join(values)
 
@@ -138,10 +172,23 @@ class GroupedSetter(Setter, metaclass=ABCMeta):
     @classmethod
     def _get_fields_from_config(cls, config: Mapping[str, Any], key: str) -> Sequence[Tag]:
         fields = to_collection(config.get(key, ()))
-        return Tag.from_name(*fields) if fields else ()
+        return _local_tags_from_names(fields) if fields else ()
 
     def _group_items[T: LocalTrack](self, item: T, collection: Iterable[T]) -> list[T]:
-        return [it for it in collection if all(it[field] == item[field] for field in self.group_by)]
+        key = self._get_group_key(item)
+        return [it for it in collection if self._get_group_key(it) == key]
+
+    def _get_group_key[T: LocalTrack](self, item: T) -> tuple[Any, ...]:
+        # convert lists to tuples so that multi-value tags can be used as keys
+        return tuple(
+            tuple(value) if isinstance(value := item[field], list) else value for field in self.group_by
+        )
+
+    def _group_collection[T: LocalTrack](self, collection: Iterable[T]) -> dict[tuple[Any, ...], list[T]]:
+        groups: dict[tuple[Any, ...], list[T]] = defaultdict(list)
+        for it in collection:
+            groups[self._get_group_key(it)].append(it)
+        return groups
 
     def as_dict(self):
         return super().as_dict() | {"group_by": self.group_by}
@@ -178,14 +225,33 @@ class Incremental(GroupedSetter):
         self.start = start
         self.increment = increment
 
-    def set[T: LocalTrack](self, item: T, collection: list[T]):
-        if not self._condition_is_valid(item):
-            return
-
+    def _set[T: LocalTrack](self, item: T, collection: list[T]):
         group = self._group_items(item, collection)
         self.sort_by.sort(group)
-        value = self.start + (group.index(item) * self.increment)
-        item[self.field] = value
+        position = next((i for i, it in enumerate(group) if it is item), None)
+        if position is None:
+            raise ValueError(f"Item not found in its group within the given collection: {item}")
+        item[self.field] = self.start + (position * self.increment)
+
+    def set_batch[T: LocalTrack](self, items: Iterable[T], collection: list[T]):
+        items = self._filter_valid(items)
+        if not items:
+            return
+
+        # group and sort each group only once, calculating the positions of every item before setting any values
+        groups = self._group_collection(collection)
+        positions: dict[int, int] = {}
+        for key in {self._get_group_key(item) for item in items}:
+            group = groups.get(key, [])
+            self.sort_by.sort(group)
+            for i, it in enumerate(group):  # keep the first position of any item repeated in the group
+                positions.setdefault(id(it), i)
+
+        for item in items:
+            if (position := positions.get(id(item))) is None:  # item not in collection, process individually
+                self._set(item, collection)
+                continue
+            item[self.field] = self.start + (position * self.increment)
 
     def as_dict(self):
         return super().as_dict() | {"sort_by": self.sort_by, "start": self.start, "increment": self.increment}
@@ -195,7 +261,7 @@ class GroupedValueSetter(GroupedSetter, metaclass=ABCMeta):
 
     @classmethod
     def from_dict(cls, field: Tag, config: Mapping[str, Any]):
-        value_of = next(iter(Tag.from_name(config["field"]))) if "field" in config else field
+        value_of = _local_tag_from_name(config["field"]) if "field" in config else field
         group_by = cls._get_fields_from_config(config, "group")
         condition = cls._get_condition_from_dict(config)
         return cls(field=field, value_of=value_of, group_by=group_by, condition=condition)
@@ -204,35 +270,79 @@ class GroupedValueSetter(GroupedSetter, metaclass=ABCMeta):
         super().__init__(field=field, group_by=group_by, condition=condition)
         self.value_of = value_of or field
 
+    def _set_batch_from_group_values[T: LocalTrack](
+            self, items: Iterable[T], collection: Iterable[T], reducer: Callable[[Any, Any], Any]
+    ) -> None:
+        items = self._filter_valid(items)
+        if not items:
+            return
+
+        # reduce the values of each group only once
+        reduced = self._reduce_group_values(collection, reducer=reducer)
+        for item in items:
+            if (value := reduced.get(self._get_group_key(item))) is not None:
+                item[self.field] = value
+
+    def _reduce_group_values[T: LocalTrack](
+            self, collection: Iterable[T], reducer: Callable[[Any, Any], Any]
+    ) -> dict[tuple[Any, ...], Any]:
+        """Reduce the non-null values of each group of items in the ``collection`` in a single running scan"""
+        reduced: dict[tuple[Any, ...], Any] = {}
+        for it in collection:
+            if (value := it[self.field]) is None:
+                continue
+
+            key = self._get_group_key(it)
+            reduced[key] = reducer(reduced[key], value) if key in reduced else value
+        return reduced
+
     def as_dict(self):
         return super().as_dict() | {"value_of": self.value_of}
 
 
 class Min(GroupedValueSetter):
 
-    def set[T: LocalTrack](self, item: T, collection: Iterable[T]):
-        if not self._condition_is_valid(item):
-            return
-
+    def _set[T: LocalTrack](self, item: T, collection: Iterable[T]):
         items = self._group_items(item=item, collection=collection)
-        values = {value for it in items if (value := it[self.field]) is not None}
-        if values:
-            item[self.field] = min(values)
+        values = (value for it in items if (value := it[self.field]) is not None)
+        value = min(values, default=None)
+        if value is not None:
+            item[self.field] = value
 
+    def set_batch[T: LocalTrack](self, items: Iterable[T], collection: Iterable[T]):
+        self._set_batch_from_group_values(items, collection, reducer=min)
 
-class Max(GroupedValueSetter):
 
-    def set[T: LocalTrack](self, item: T, collection: Iterable[T]):
-        if not self._condition_is_valid(item):
-            return
+class Max(GroupedValueSetter):
 
+    def _set[T: LocalTrack](self, item: T, collection: Iterable[T]):
         items = self._group_items(item=item, collection=collection)
-        values = {value for it in items if (value := it[self.field]) is not None}
-        if values:
-            item[self.field] = max(values)
+        values = (value for it in items if (value := it[self.field]) is not None)
+        value = max(values, default=None)
+        if value is not None:
+            item[self.field] = value
+
+    def set_batch[T: LocalTrack](self, items: Iterable[T], collection: Iterable[T]):
+        self._set_batch_from_group_values(items, collection, reducer=max)
+
+
+#: Matches escaped braces or a replacement field in a template, capturing its field name, conversion, and format spec
+_TEMPLATE_FIELD_REGEX = re.compile(r"\{\{|}}|\{([^{}!:]*)(?:!([rsa]))?(?::([^{}]*))?}")
+_TEMPLATE_CONVERSIONS: dict[str, Callable[[Any], str]] = {"r": repr, "s": str, "a": ascii}
 
 
 class Template(Setter):
+    @property
+    def fields(self) -> Mapping[str, Getter]:
+        """The getters to use when getting the values of fields in the template, mapped by field name"""
+        return self._fields
+
+    @fields.setter
+    def fields(self, value: Mapping[str, Getter]):
+        self._fields = value
+        if hasattr(self, "_segments"):
+            self._prepare_render()
+
     @property
     def template(self) -> str:
         """The template string to use when formatting the final string value"""
@@ -240,13 +350,61 @@ class Template(Setter):
 
     @template.setter
     def template(self, value: str):
-        self._required_fields = set(fn for _, fn, _, _ in Formatter().parse(value) if fn is not None)
+        self._segments = self._parse_template(value)
+        self._required_fields = set(fn for _, fn, _, _ in self._segments if fn is not None)
         # noinspection PyTypeChecker
-        missing_fields: set[str] = self._required_fields - set(self.fields) - Tag.__tags__
+        missing_fields: set[str] = self._required_fields - self.fields.keys() - Tag.__tags__
         if missing_fields:
             raise ParserError(f"Template contains fields which have not been configured: {', '.join(missing_fields)}")
 
         self._template = value
+        self._prepare_render()
+
+    def _prepare_render(self) -> None:
+        """Resolve the getter and conversion for each parsed segment once and select the renderer to use"""
+        self._resolved_segments = tuple(
+            (literal, field, self.fields.get(field), format_spec, _TEMPLATE_CONVERSIONS.get(conversion))
+            for literal, field, format_spec, conversion in self._segments
+        )
+        self._render = self._get_renderer()
+
+    def _get_renderer(self) -> Callable[[LocalTrack], str]:
+        """Get the most specialised function which can render the currently parsed template"""
+        if not self._required_fields:
+            return self._render_literal
+
+        literal, field, format_spec, conversion = self._segments[0]
+        if len(self._segments) == 1 and not literal and not format_spec and not conversion and field not in self.fields:
+            return self._render_tag
+        return self._render_segments
+
+    @staticmethod
+    def _parse_template(value: str) -> list[tuple[str, str | None, str | None, str | None]]:
+        """Parse the given template ``value`` into (literal, field name, format spec, conversion) segments"""
+        segments = []
+        literal = ""
+        position = 0
+        for match in [*_TEMPLATE_FIELD_REGEX.finditer(value), None]:
+            text = value[position:match.start() if match is not None else len(value)]
+            if "{" in text or "}" in text:
+                raise ParserError("Template contains unmatched braces", value=value)
+            literal += text
+
+            if match is None:
+                break
+            position = match.end()
+
+            if match.group() in ("{{", "}}"):  # escaped brace
+                literal += match.group()[0]
+                continue
+
+            field, conversion, format_spec = match.groups()
+            segments.append((literal, field, format_spec, conversion))
+            literal = ""
+
+        if literal:
+            segments.append((literal, None, None, None))
+        return segments
 
     @classmethod
     def from_dict(cls, field: Tag, config: Mapping[str, Any]):
@@ -266,25 +424,41 @@ class Template(Setter):
         self.fields = fields if fields is not None else {}
         self.template = template
 
-    def set[T: LocalTrack](self, item: T, collection: Iterable[T]) -> None:
-        if not self._condition_is_valid(item):
-            return
+    def _set[T: LocalTrack](self, item: T, collection: Iterable[T]) -> None:
+        item[self.field] = self._render(item)
+
+    def _render_literal[T: LocalTrack](self, item: T) -> str:
+        """Render a template which contains no fields i.e. a constant string"""
+        return self._segments[0][0] if self._segments else ""
 
-        values_map = {key: getter.get(item) for key, getter in self.fields.items()}
-        for field in self._required_fields - set(self.fields):
-            values_map[field] = item[field]
+    def _render_tag[T: LocalTrack](self, item: T) -> str:
+        """Render a template which contains only a single tag field with no formatting e.g. '{title}'"""
+        value = item[self._segments[0][1]]
+        return str(value) if value is not None else ""
 
-        for key, val in values_map.items():
-            if val is None:
-                values_map[key] = ""
+    def _render_segments[T: LocalTrack](self, item: T) -> str:
+        """Render the template by formatting each of its parsed segments in turn"""
+        parts = []
+        for literal, field, getter, format_spec, convert in self._resolved_segments:
+            parts.append(literal)
+            if field is None:
+                continue
 
-        item[self.field] = self.template.format_map(values_map)
+            value = getter.get(item) if getter is not None else item[field]
+            if value is None:  # substitute an empty string before converting and formatting, as with str.format_map
+                value = ""
+            if convert is not None:
+                value = convert(value)
+            parts.append(format(value, format_spec) if format_spec else str(value))
+
+        return "".join(parts)
 
     def as_dict(self):
         return super().as_dict() | {"fields": self.fields, "template": self.template}
 
 
 SETTERS: list[type[Setter]] = [Clear, Min, Max, Join, Incremental, Template]
+_SETTERS_MAP: dict[str, type[Setter]] = {cls.__name__.lower(): cls for cls in SETTERS}
 
 
 def setter_from_config(field: Tag, config: Any | Mapping[str, Any]) -> Setter:
@@ -292,14 +466,12 @@ def setter_from_config(field: Tag, config: Any | Mapping[str, Any]) -> Setter:
     if not isinstance(config, Mapping):
         return Value(field=field, value=config)
 
-    setters_map = {cls.__name__.lower(): cls for cls in SETTERS}
-
     operation = config.get("operation")
-    if operation not in setters_map:
+    if operation not in _SETTERS_MAP:
         if "value" in config:
             return Value.from_dict(field, config)
         elif "field" in config:
             return Field.from_dict(field, config)
         raise ParserError("Unrecognised {key}", key="operation", value=operation)
 
-    return setters_map[operation].from_dict(field, config)
+    return _SETTERS_MAP[operation].from_dict(field, config)
@@ -7,7 +7,6 @@ from typing import Any, Self
 
 from musify.base import MusifyItemSettable
 from musify.libraries.local.track import LocalTrack
-from musify.libraries.local.track.field import LocalTrackField
 from musify.printer import PrettyPrinter
 from musify.processors.base import Filter
 from musify.processors.filter import FilterDefinedList
@@ -15,7 +14,7 @@ from pydantic import GetCoreSchemaHandler
 from pydantic_core import CoreSchema, core_schema
 
 from musify_cli.config.operations.filters import get_comparers_filter
-from musify_cli.config.operations.tagger._setter import Setter, setter_from_config
+from musify_cli.config.operations.tagger._setter import Setter, setter_from_config, _local_tag_from_name
 
 
 @dataclass
@@ -24,15 +23,15 @@ class FilteredSetter[T: MusifyItemSettable](PrettyPrinter):
     filter: Filter[T] | None = field(default_factory=FilterDefinedList)
     setters: Collection[Setter] = ()
 
-    def set_tags(self, item: T, collection: Collection[T]) -> None:
+    def set_tags(self, items: Collection[T], collection: Collection[T]) -> None:
         """
-        Apply setters on the given ``item`` from the given ``collection``.
+        Apply setters on the given ``items`` from the given ``collection``.
 
-        :param item: The item to set tags for.
-        :param collection: The collection the given item belongs to.
+        :param items: The items to set tags for.
+        :param collection: The collection all the given items belong to.
         """
         for setter in self.setters:
-            setter.set(item, collection)
+            setter.set_batch(items, collection)
 
     def as_dict(self):
         return {"filter": self.filter, "setters": self.setters}
@@ -76,7 +75,7 @@ class Tagger[T: MusifyItemSettable](PrettyPrinter):
                     condition = get_comparers_filter(filter_config)
 
                 setters = [
-                    setter_from_config(next(iter(LocalTrackField.from_name(fld))), rule_config)
+                    setter_from_config(_local_tag_from_name(fld), rule_config)
                     for fld, rule_config in rule_set.items() if fld not in ["filter", "field"]
                 ]
                 setter = FilteredSetter[LocalTrack](filter=condition, setters=setters)
@@ -96,18 +95,28 @@ class Tagger[T: MusifyItemSettable](PrettyPrinter):
         :param collections: The collections the given items belong to.
             Each item must to exactly one collection for this function to work as expected.
         """
-        matched = set()
+        collection_map: dict[int, Collection[T]] = {}  # map of item ID to the first collection it belongs to
+        for coll in collections:
+            for it in coll:
+                collection_map.setdefault(id(it), coll)
+
+        items = list(items)  # process the same materialised sequence for every rule
+        matched: set[int] = set()  # IDs of items matched by any rule so far
         for rule in self.rules:
             if rule.filter is None:
-                filtered_items = [item for item in items if item not in matched]
+                filtered_items = [item for item in items if id(item) not in matched]
             else:
                 filtered_items = rule.filter(items)
-            matched.update(set(filtered_items))
+            matched.update(map(id, filtered_items))
+
+            # group items by the collection they belong to so that setters may process each collection in one batch
+            batches: dict[int, tuple[Collection[T], list[T]]] = {}
+            for item in filtered_items:
+                collection = collection_map.get(id(item), ())
+                batches.setdefault(id(collection), (collection, []))[1].append(item)
 
-            for setter in rule.setters:
-                for item in filtered_items:
-                    collection = next(iter(coll for coll in collections if item in coll), ())
-                    setter.set(item, collection)
+            for collection, batch in batches.values():
+                rule.set_tags(batch, collection)
 
     def as_dict(self):
         return {"rules": self.rules}
@@ -2,7 +2,7 @@
 Handles config relating to tags, including defining annotations to be used in Pydantic models.
 """
 from collections.abc import Collection
-from functools import partial
+from functools import partial, lru_cache
 from typing import Annotated
 
 from aiorequestful.types import UnitCollection
@@ -17,12 +17,24 @@ FIELD_NAMES = [field.name.lower() for field in Fields.all()]
 TAG_NAMES = [field.name.lower() for field in TagFields.all()]
 # noinspection PyTypeChecker
 LOCAL_TRACK_TAG_NAMES: list[str] = list(sorted(
-    set(LocalTrackField.__tags__), key=lambda x: FIELD_NAMES.index(x)
+    set(LocalTrackField.__tags__), key={name: i for i, name in enumerate(FIELD_NAMES)}.__getitem__
 ))
 
 type TagConfigType[T: TagField] = UnitCollection[str] | UnitCollection[T] | None
 
 
+@lru_cache
+def _order_map[T: TagField](cls: type[T]) -> dict[T, int]:
+    """Map each :py:class:`Field` enum of the given ``cls`` to its position in the ordered list of all fields"""
+    return {field: i for i, field in enumerate(cls.all())}
+
+
+@lru_cache
+def _all_tags[T: TagField](cls: type[T]) -> tuple[T, ...]:
+    """Get all the tag :py:class:`Field` enums of the given ``cls``"""
+    return tuple(cls.all(only_tags=True))
+
+
 def get_tags[T: TagField](tags: TagConfigType[T], cls: type[T] = LocalTrackField) -> tuple[T, ...]:
     """Get the :py:class:`Field` enums of the given ``cls`` for a given list of ``tags``"""
     if isinstance(tags, Collection) and all(v.__class__ == cls for v in tags):
@@ -32,10 +44,9 @@ def get_tags[T: TagField](tags: TagConfigType[T], cls: type[T] = LocalTrackField
 
     values = to_collection(tags, tuple)
     if not values or (isinstance(tags, Field) and tags.value == Fields.ALL):
-        return tuple(cls.all(only_tags=True))
+        return _all_tags(cls)
 
-    order = cls.all()
-    return tuple(sorted(cls.from_name(*values), key=lambda x: order.index(x)))
+    return tuple(sorted(cls.from_name(*values), key=_order_map(cls).__getitem__))
 
 
 def serialise_tags(fields: UnitCollection[TagField]) -> list[str]:
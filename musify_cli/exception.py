@@ -1,11 +1,9 @@
 """
 Exceptions for the entire program.
 """
-from collections.abc import Iterable
 from typing import Any
 
 from musify.exception import MusifyError
-from musify.utils import SafeDict
 
 
 class ParserError(MusifyError, ValueError):
@@ -19,19 +17,17 @@ class ParserError(MusifyError, ValueError):
     def __init__(self, message: str = "Could not process config", key: Any | None = None, value: Any | None = None):
         suffix = []
 
-        key = "->".join(key) if isinstance(key, Iterable) and not isinstance(key, str) else key
+        key = "->".join(map(str, key)) if isinstance(key, (list, tuple)) else key
         if key and "{key}" in message:
-            message = message.format_map(SafeDict(key=key))
+            message = message.replace("{key}", str(key))
         elif key:
             suffix.append(f"key='{key}'")
 
-        try:
-            value = ", ".join(value) if isinstance(value, Iterable) and not isinstance(value, str) else value
-        except TypeError:
-            value = str(value)
+        if isinstance(value, (list, tuple, set, frozenset)):
+            value = ", ".join(map(str, value))
 
         if value and "{value}" in message:
-            message = message.format_map(SafeDict(value=value))
+            message = message.replace("{value}", str(value))
         elif value:
             suffix.append(f"value='{value}'")
 
@@ -39,4 +35,4 @@ class ParserError(MusifyError, ValueError):
         self.value = value
         self.message = message
 
-        super().__init__(": ".join([message, " | ".join(suffix)]) if suffix else message)
+        super().__init__(f"{message}: {" | ".join(suffix)}" if suffix else message)
@@ -1,17 +1,113 @@
 """
 All logging handlers specific to this package.
 """
+import heapq
 import logging.handlers
 import os
+import re
 import shutil
 import tempfile
+from collections.abc import Iterable
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 
 from musify.processors.time import TimeMapper
 
 from musify_cli.log import LOGGING_DT_FORMAT
 
+#: Whether files and folders may be removed relative to an open directory file descriptor on this platform
+_REMOVE_WITH_DIR_FD = (
+    hasattr(os, "O_DIRECTORY") and os.unlink in os.supports_dir_fd and shutil.rmtree.avoids_symlink_attacks
+)
+
+#: Map of the supported datetime format directives to the datetime argument, formatted width,
+#: and minimum width accepted by :py:meth:`datetime.strptime` for their values
+_DT_DIRECTIVES: dict[str, tuple[str, int, int]] = {
+    "%Y": ("year", 4, 4),
+    "%m": ("month", 2, 1),
+    "%d": ("day", 2, 1),
+    "%H": ("hour", 2, 1),
+    "%M": ("minute", 2, 1),
+    "%S": ("second", 2, 1),
+}
+
+
+def _compile_dt_format(dt_format: str) -> tuple[re.Pattern[str], int, int] | None:
+    """
+    Compile a regex pattern which fully matches strings formatted with the given ``dt_format``,
+    capturing each value in a group named for its datetime argument.
+    Also returns the minimum and maximum length of strings which :py:meth:`datetime.strptime` may accept.
+    Returns None if the format contains any directives which do not produce fixed width values.
+    """
+    pattern = ""
+    min_length = max_length = 0
+    i = 0
+    while i < len(dt_format):
+        if dt_format[i] != "%":
+            pattern += re.escape(dt_format[i])
+            min_length += 1
+            max_length += 1
+            i += 1
+            continue
+
+        if (directive := dt_format[i:i + 2]) not in _DT_DIRECTIVES:
+            return
+        arg, width, min_width = _DT_DIRECTIVES[directive]
+        if f"(?P<{arg}>" in pattern:  # repeated directive
+            return
+
+        pattern += f"(?P<{arg}>[0-9]{{{width}}})"
+        min_length += min_width
+        max_length += width
+        i += 2
+
+    return re.compile(pattern), min_length, max_length
+
+
+_LOGGING_DT_PATTERN = _compile_dt_format(LOGGING_DT_FORMAT)
+
+
+def _parse_log_dt(value: str) -> datetime | None:
+    """
+    Parse the given ``value`` formatted with :py:const:`LOGGING_DT_FORMAT` to a datetime.
+    Values are matched by a precompiled pattern when possible, falling back to :py:meth:`datetime.strptime` otherwise.
+    Returns None when the value does not match the format.
+    """
+    try:
+        if _LOGGING_DT_PATTERN is None:
+            return datetime.strptime(value, LOGGING_DT_FORMAT)
+
+        pattern, min_length, max_length = _LOGGING_DT_PATTERN
+        if not min_length <= len(value) <= max_length:  # reject values which can never match without parsing
+            return
+        if (match := pattern.fullmatch(value)) is None:
+            return datetime.strptime(value, LOGGING_DT_FORMAT)
+        return datetime(**{arg: int(part) for arg, part in match.groupdict().items()})
+    except ValueError:
+        return
+
+
+@lru_cache
+def _split_placeholder(filename: str) -> tuple[str, str, str] | None:
+    """
+    Get the normalised folder of the '{...}' placeholder in the given ``filename``
+    and the base name prefix and the suffix either side of it.
+    Returns None if the filename does not contain a placeholder.
+    """
+    head, sep, tail = filename.partition("{")
+    if not sep or "}" not in tail:
+        return
+    folder, prefix = os.path.split(head)
+    return os.path.normpath(folder), prefix, tail.split("}")[1]
+
+
+def _is_empty_dir(path: str) -> bool:
+    """Check whether the directory at the given ``path`` is empty, stopping at the first entry found"""
+    with os.scandir(path) as it:
+        return next(it, None) is None
+
 
 class CurrentTimeRotatingFileHandler(logging.handlers.BaseRotatingHandler):
     """
@@ -81,33 +177,69 @@ class CurrentTimeRotatingFileHandler(logging.handlers.BaseRotatingHandler):
         Removes files older than ``self.delta`` and the oldest files when number of files >= count
         until number of files <= count. ``formatted`` path is excluded from processing.
         """
-        formatted = Path(formatted)
-        folder = formatted.parent
-        if not folder:
-            return
+        formatted = os.path.normpath(formatted)
+        folder = os.path.dirname(formatted) or os.curdir
+        formatted_name = os.path.basename(formatted)
+
+        # get prefix+suffix to remove when processing
+        # entries only match the placeholder when they are in the same folder as it, as if matching the full path
+        placeholder = _split_placeholder(unformatted)
+        has_placeholder = placeholder is not None and placeholder[0] == folder
+        prefix, suffix = placeholder[1:] if has_placeholder else ("", "")
+        prefix_len = len(prefix)
+
+        count = self.count
+        cutoff = self.dt - self.delta if self.delta is not None else None
+        rotate = count is not None or cutoff is not None
+        removed = self.removed
+        removed_set = set(removed)
+
+        to_remove: list[tuple[str, bool]] = []  # (name, is_dir) of entries to remove once all decisions are made
+        with os.scandir(folder) as it:
+            entries: Iterable[os.DirEntry] = (entry for entry in it if entry.name != formatted_name)
+
+            evict = set()
+            if count is not None:  # only need to hold all entries in memory when evicting by count
+                entries = list(entries)
+
+                # the oldest entries to remove so that count - 1 entries remain, including the current file/folder
+                evict_count = len(entries) - count + 2
+                evict = {entry.name for entry in heapq.nsmallest(evict_count, entries, key=attrgetter("name"))}
+
+            for entry in entries:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if not rotate and not (is_dir and _is_empty_dir(entry.path)):
+                    continue  # no rotation policy configured, only empty folders are removed
+
+                name = entry.name
+                too_many = name in evict
 
-        # get current files present and prefix+suffix to remove when processing
-        paths = tuple(f for f in list(folder.glob("*")) if f != formatted)
-        prefix = unformatted.split("{")[0] if "{" in unformatted and "}" in unformatted else ""
-        suffix = unformatted.split("}")[1] if "{" in unformatted and "}" in unformatted else ""
+                dt_file = None
+                if has_placeholder and name.startswith(prefix):
+                    dt_file = _parse_log_dt(name[prefix_len:].removesuffix(suffix))
+                too_old = dt_file is not None and cutoff is not None and dt_file < cutoff
 
-        remaining = len(paths)
-        for path in sorted(paths):
-            too_many = self.count is not None and remaining >= (self.count - 1)  # -1 for current file/folder
+                # only probe folders for emptiness when they are not already being removed
+                if too_many or too_old or (is_dir and (not rotate or _is_empty_dir(entry.path))):
+                    to_remove.append((name, is_dir))
 
-            dt_part = str(path).removeprefix(prefix).removesuffix(suffix)
-            try:
-                dt_file = datetime.strptime(dt_part, LOGGING_DT_FORMAT)
-                too_old = self.delta is not None and dt_file < self.dt - self.delta
-            except ValueError:
-                dt_file = None
-                too_old = False
+                    if dt_file and dt_file not in removed_set:
+                        removed.append(dt_file)
+                        removed_set.add(dt_file)
 
-            is_empty = path.is_dir() and not list(path.glob("*"))
+        if not to_remove:
+            return
 
-            if too_many or too_old or is_empty:
-                os.remove(path) if path.is_file() else shutil.rmtree(path)
-                remaining -= 1
+        if not _REMOVE_WITH_DIR_FD:
+            for name, is_dir in to_remove:
+                path = os.path.join(folder, name)
+                shutil.rmtree(path) if is_dir else os.remove(path)
+            return
 
-                if dt_file and dt_file not in self.removed:
-                    self.removed.append(dt_file)
+        # open the folder once and remove each entry relative to it to avoid resolving the full path every time
+        dir_fd = os.open(folder, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            for name, is_dir in to_remove:
+                shutil.rmtree(name, dir_fd=dir_fd) if is_dir else os.unlink(name, dir_fd=dir_fd)
+        finally:
+            os.close(dir_fd)
@@ -242,8 +242,14 @@ class MusifyProcessor(DynamicProcessor, AsyncContextManager):
         albums = self.local.library.albums
         tracks_with_no_album = [track for track in self.local.library if not track.album]
         albums.append(BasicCollection(name="<unknown album>", items=tracks_with_no_album))
-        [album.items.remove(track) for album in albums for track in album.items.copy() if track.has_uri is not None]
-        albums = [album for album in albums if len(album.items) > 0]
+
+        # remove tracks which are already matched or unavailable and drop albums with no tracks left to search for
+        albums_to_search = []
+        for album in albums:
+            album.items[:] = [track for track in album.items if track.has_uri is None]
+            if album.items:
+                albums_to_search.append(album)
+        albums = albums_to_search
 
         if len(albums) == 0:
             self.logger.info("\33[1;95m ->\33[0;90m All items matched or unavailable. Skipping search.\33[0m")
@@ -7,7 +7,7 @@ import logging.config
 import os
 import re
 from abc import ABC, abstractmethod
-from collections.abc import Mapping
+from collections.abc import Mapping, Collection
 from functools import cached_property
 from pathlib import Path
 from typing import Any
@@ -20,6 +20,8 @@ from musify.utils import get_user_input
 
 from musify_cli.config.library import LibraryConfig
 
+_BACKUP_KEY_REGEX = re.compile(r"^\[(\w+)]")
+
 
 class LibraryManager[L: Library, C: LibraryConfig](ABC):
     """Generic base class for instantiating and managing a library and related objects from a given ``config``."""
@@ -53,11 +55,17 @@ class LibraryManager[L: Library, C: LibraryConfig](ABC):
     ## Backup/Restore - Utilities
     ###########################################################################
     def _save_json(self, path: str | Path, data: Mapping[str, Any]) -> None:
-        """Save a JSON file to a given ``path``"""
+        """
+        Save a compact JSON file to a given ``path``.
+
+        :param path: The path to save to. The suffix is always replaced with '.json'.
+        :param data: The data to save.
+        """
         path = Path(path).with_suffix(".json")
 
-        with open(path, "w") as file:
-            json.dump(data, file, indent=2)
+        # json.dump writes many small chunks, buffer them into fewer, larger writes
+        with open(path, "w", buffering=1024 * 1024) as file:
+            json.dump(data, file, separators=(",", ":"))
 
         self.logger.info(f"\33[1;95m  >\33[1;97m Saved JSON file: \33[1;92m{path}\33[0m")
 
@@ -110,7 +118,7 @@ class LibraryManager[L: Library, C: LibraryConfig](ABC):
             self.logger.info("\33[93mNo backups found, skipping.\33[0m")
             return
 
-        restore_dir = self._get_restore_dir_from_user(backup_folder)
+        restore_dir = self._get_restore_dir_from_user(backup_folder, available_groups=available_groups)
         restore_key = self._get_restore_key_from_user(restore_dir)
         restore_path = restore_dir.joinpath(restore_key)
 
@@ -127,24 +135,22 @@ class LibraryManager[L: Library, C: LibraryConfig](ABC):
     def _get_available_backup_groups(self, backup_folder: Path) -> list[str]:
         backup_name = self._get_library_backup_name()
 
-        available_backups: list[str] = []  # names of the folders which contain usable backups
-        for parent, _, filenames in backup_folder.walk():
-            if parent == backup_folder:  # skip current run's data
-                continue
-            group = parent.relative_to(backup_folder).name  # backup group is the folder name
-
-            for file in map(Path, filenames):
-                if group in available_backups:
-                    break
-                if backup_name in file.stem:
-                    available_backups.append(group)
-                    break
+        available_backups: set[str] = set()  # names of the folders which contain usable backups
+        with os.scandir(backup_folder) as groups:
+            for group in groups:  # backup group is the folder name, skip current run's data in the root folder
+                if not group.is_dir(follow_symlinks=False):
+                    continue
 
-        return available_backups
+                with os.scandir(group.path) as files:
+                    if any(
+                        backup_name in os.path.splitext(file.name)[0]
+                        for file in files if not file.is_dir(follow_symlinks=False)
+                    ):
+                        available_backups.add(group.name)
 
-    def _get_restore_dir_from_user(self, backup_folder: Path) -> Path:
-        available_groups = self._get_available_backup_groups(backup_folder)
+        return sorted(available_backups)
 
+    def _get_restore_dir_from_user(self, backup_folder: Path, available_groups: Collection[str]) -> Path:
         self.logger.info(
             "\33[97mAvailable backups: \n\t\33[97m- \33[94m{}\33[0m"
             .format("\33[0m\n\t\33[97m-\33[0m \33[94m".join(available_groups))
@@ -160,7 +166,8 @@ class LibraryManager[L: Library, C: LibraryConfig](ABC):
         return backup_folder.joinpath(group)
 
     def _get_restore_key_from_user(self, path: Path) -> str:
-        available_keys = {re.sub(r"^\[(\w+)].*", "\\1", file) for file in os.listdir(path)}
+        # only backups saved with a key can be selected, skip any others
+        available_keys = {match.group(1) for file in os.listdir(path) if (match := _BACKUP_KEY_REGEX.match(file))}
 
         self.logger.info(
             "\33[97mAvailable backup keys: \n\t\33[97m- \33[94m{}\33[0m"
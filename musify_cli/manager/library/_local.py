@@ -55,10 +55,9 @@ class LocalLibraryManager[L: LocalLibrary, C: LocalLibraryConfig](LibraryManager
             f"{path.name} | Tags: {', '.join(tag_names)}\33[0m"
         )
 
+        # the library indexes the backed up tracks by path itself, pass them straight through
         backup = self._load_json(path)
-        tracks = {track["path"]: track for track in backup["tracks"]}
-
-        self.library.restore_tracks(tracks, tags=tags)
+        self.library.restore_tracks(backup["tracks"], tags=tags)
         results = await self.library.save_tracks(tags=tags, replace=True, dry_run=self.dry_run)
 
         self.library.log_save_tracks_result(results)
@@ -1,7 +1,7 @@
 """
 The remote library manager.
 """
-from collections.abc import Iterable
+from collections.abc import Collection, Callable
 from functools import cached_property
 from pathlib import Path
 from typing import AsyncContextManager, Self
@@ -241,7 +241,8 @@ class RemoteLibraryManager[L: RemoteLibrary, C: RemoteLibraryConfig](LibraryMana
         """Create a playlist of new music released by user's followed artists"""
         self.logger.debug("New music playlist: START")
 
-        await self._load_followed_artist_albums()
+        # only albums released within the configured dates are needed, skip getting tracks for any others
+        await self._load_followed_artist_albums(albums_filter=self.config.new_music.match_date)
         pl, results = await self.config.new_music(self.library, dry_run=self.dry_run)
 
         self.logger.print_line(STAT)
@@ -251,8 +252,12 @@ class RemoteLibraryManager[L: RemoteLibrary, C: RemoteLibraryConfig](LibraryMana
 
         self.logger.debug("New music playlist: DONE")
 
-    async def _load_followed_artist_albums(self) -> None:
-        """Load all followed artists and all their albums to the library, refreshing if necessary."""
+    async def _load_followed_artist_albums(self, albums_filter: Callable[[RemoteAlbum], bool]) -> None:
+        """
+        Load all followed artists and all their albums to the library, refreshing if necessary.
+
+        :param albums_filter: Only extend the tracks of the albums which match this filter.
+        """
         load_albums = any([
             LoadTypesRemote.SAVED_ARTISTS not in self.types_loaded,
             EnrichTypesRemote.ALBUMS not in self.types_enriched.get(LoadTypesRemote.SAVED_ARTISTS, [])
@@ -263,7 +268,7 @@ class RemoteLibraryManager[L: RemoteLibrary, C: RemoteLibraryConfig](LibraryMana
 
         albums_to_extend = [
             album for artist in self.library.artists for album in artist.albums
-            if len(album.tracks) < album.track_total
+            if len(album.tracks) < album.track_total and albums_filter(album)
         ]
         await self._extend_albums(albums_to_extend)
 
@@ -273,15 +278,9 @@ class RemoteLibraryManager[L: RemoteLibrary, C: RemoteLibraryConfig](LibraryMana
             self.library.log_artists()
             self.logger.print_line()
 
-    async def _extend_albums(self, albums: Iterable[RemoteAlbum]) -> None:
+    async def _extend_albums(self, albums: Collection[RemoteAlbum]) -> None:
         """Extend responses of given ``albums`` to include all available tracks for each album."""
-        kind = RemoteObjectType.ALBUM
-        key = self.api.collection_item_map[kind]
-
-        await self.logger.get_asynchronous_iterator(
-            (self.api.extend_items(album.response, kind=kind, key=key, leave_bar=False) for album in albums),
-            desc="Getting album tracks",
-            unit="albums"
-        )
-        for album in albums:
-            album.refresh(skip_checks=False)
+        # get the albums in batches, which include the first page of tracks for each album,
+        # only the albums which still have more tracks to get are then extended page by page.
+        # the API merges the new responses into the given albums and refreshes them
+        await self.api.get_items(albums, kind=RemoteObjectType.ALBUM, extend=True)
@@ -121,6 +121,33 @@ class TestRemoteNewMusicConfig:
 
         return expected
 
+    def test_remove_duplicate_tracks(self):
+        def get_track(title: str, artists: list[str], album: str) -> RemoteTrackMock:
+            response = {"id": random_str(), "name": title, "album": {"name": album}, "artists": []}
+            for artist in artists:
+                response["artists"].append({"id": artist, "name": artist, "type": "artist"})
+            for item in [response] + response["artists"]:
+                item |= {"href": "", "uri": "", "external_urls": {}}
+            return self.track_mock(response)
+
+        tracks = [get_track(random_str(), [random_str(), random_str()], random_str()) for _ in range(20)]
+        for original in tracks[:10]:  # matches on title, album, and any shared artist
+            tracks.append(get_track(original.title, [original.artists[1].name, random_str()], original.album))
+        for original in tracks[10:15]:  # same title and artists on a different album is not a duplicate
+            tracks.append(get_track(original.title, [artist.name for artist in original.artists], random_str()))
+        tracks.extend(tracks[5:8])  # matches on URI
+
+        expected = []
+        for track in tracks:
+            if not any(track == kept for kept in expected):
+                expected.append(track)
+
+        # noinspection PyTestUnpassedFixture
+        result = RemoteNewMusicConfig._remove_duplicate_tracks(tracks)
+        assert result == expected
+        assert [id(track) for track in result] == [id(track) for track in expected]
+        assert len(result) == 25
+
     def test_filter_artist_albums_by_date(
             self,
             model: RemoteNewMusicConfig,
@@ -250,7 +277,7 @@ class TestRemotePlaylistsSync:
             pl.tracks.extend(self.track_mock({}) for _ in range(50))
         return playlists
 
-    def test_filter_playlists_on_tags(self, model: RemotePlaylistsSync, playlists: list[RemotePlaylistMock]):
+    def test_filter_tracks_on_tags(self, model: RemotePlaylistsSync, playlists: list[RemotePlaylistMock]):
         filter_names = [item.name for item in next(pl for pl in playlists if len(pl) > 0)[:2]]
         model.filter = {"name": [name.upper() + "  " for name in filter_names]}
 
@@ -263,11 +290,19 @@ class TestRemotePlaylistsSync:
         if len(expected_counts) == 0:
             raise Exception("Can't check filter_tags logic, no items to filter out from playlists")
 
-        filtered_playlists = model._filter_playlists(playlists)
-        for pl in filtered_playlists:
+        filtered_tracks = model._filter_tracks(playlists)
+        for pl, tracks in zip(playlists, filtered_tracks):
             if pl.name not in expected_counts:
                 continue
-            assert len(pl) == expected_counts[pl.name]
+            assert len(tracks) == expected_counts[pl.name]
+
+    def test_filter_tracks_with_no_filter(self, model: RemotePlaylistsSync, playlists: list[RemotePlaylistMock]):
+        for tag_filter in ({}, {"name": [], "artist": ()}):
+            model.filter = tag_filter
+
+            filtered_tracks = model._filter_tracks(playlists)
+            assert filtered_tracks == [pl.tracks for pl in playlists]
+            assert all(tracks is not pl.tracks for pl, tracks in zip(playlists, filtered_tracks))
 
     @pytest.mark.parametrize("dry_run", [True, False])
     async def test_sync(
@@ -283,8 +318,12 @@ class TestRemotePlaylistsSync:
         }
 
         assert not library.playlists
+        tracks_before = {pl.name: pl.tracks.copy() for pl in playlists}
         await model.run(library=library, playlists=playlists, dry_run=dry_run)
 
+        # the given playlists are not modified by the filter
+        assert {pl.name: pl.tracks for pl in playlists} == tracks_before
+
         assert library.sync_args["kind"] == model.kind
         assert library.sync_args["reload"] == model.reload
         assert library.sync_args["dry_run"] == dry_run
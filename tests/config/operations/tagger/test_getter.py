@@ -1,5 +1,7 @@
 from abc import ABCMeta, abstractmethod
+from pathlib import PurePosixPath
 from random import choice
+from types import SimpleNamespace
 
 import pytest
 from musify.field import TagFields
@@ -218,3 +220,13 @@ class TestPathGetter:
 
         getter = PathGetter(2)
         assert getter.get(track) == track.path.parts[-3]
+
+    def test_get_beyond_parents(self):
+        item = SimpleNamespace(path=PurePosixPath("/folder/file.mp3"))
+        assert PathGetter(2).get(item) == "/"  # the root gives the anchor
+        with pytest.raises(IndexError):
+            PathGetter(3).get(item)
+
+        item = SimpleNamespace(path=PurePosixPath("folder/file.mp3"))
+        with pytest.raises(IndexError):
+            PathGetter(2).get(item)
@@ -93,6 +93,30 @@ class SetterTester(metaclass=ABCMeta):
         setter.set(conditional_track, conditional_tracks)
         assert conditional_track[setter.field] == original_value
 
+    @staticmethod
+    def test_conditional_set_batch(setter: Setter, conditional_tracks: list[LocalTrack]):
+        comparer = Comparer(condition="is_in", expected=["this", "or", "that"], field=TagFields.ARTIST)
+        setter.condition = FilterComparers(comparer)
+
+        invalid_tracks = sample(conditional_tracks, k=len(conditional_tracks) // 2)
+        for track in conditional_tracks:
+            track.artist = random_str(10, 15) if track in invalid_tracks else choice(comparer.expected)
+        original_values = {id(track): track[setter.field] for track in conditional_tracks}
+        valid_tracks = [track for track in conditional_tracks if track not in invalid_tracks]
+
+        # get the values produced by setting each valid track individually, then reset all tracks
+        for track in valid_tracks:
+            setter.set(track, conditional_tracks)
+        expected_values = {id(track): track[setter.field] for track in valid_tracks}
+        for track in conditional_tracks:
+            track[setter.field] = original_values[id(track)]
+
+        setter.set_batch(conditional_tracks, conditional_tracks)
+        for track in invalid_tracks:
+            assert track[setter.field] == original_values[id(track)]
+        for track in valid_tracks:
+            assert track[setter.field] == expected_values[id(track)]
+
 
 class TestValue(SetterTester):
     @pytest.fixture
@@ -345,6 +369,18 @@ class TestIncremental(GroupedSetterTester):
         setter.sort_by.sort(tracks_group)
         assert track.track_number == -2 + (tracks_group.index(track) * 3)
 
+    def test_set_item_not_in_collection_fails(self, setter: Incremental, track: LocalTrack, tracks: list[LocalTrack]):
+        with pytest.raises(ValueError, match="not found"):
+            setter.set(track, [tr for tr in tracks if tr is not track])
+
+    def test_set_batch(self, setter: Incremental, tracks: list[LocalTrack], tracks_group: list[LocalTrack]):
+        expected = tracks_group.copy()
+        setter.sort_by.sort(expected)
+
+        setter.set_batch(tracks_group, tracks)
+        for i, track in enumerate(expected):
+            assert track.track_number == -2 + (i * 3)
+
 
 class GroupedValueSetterTester(GroupedSetterTester, metaclass=ABCMeta):
 
@@ -420,6 +456,11 @@ class TestMin(GroupedValueSetterTester):
         setter.set(track, tracks)
         assert track.album == min(tr.album for tr in tracks_group)
 
+    def test_set_batch(self, setter: GroupedValueSetter, tracks: list[LocalTrack], tracks_group: list[LocalTrack]):
+        expected = min(tr.track_number for tr in tracks_group)
+        setter.set_batch(tracks_group, tracks)
+        assert all(tr.track_number == expected for tr in tracks_group)
+
 
 class TestMax(GroupedValueSetterTester):
     @pytest.fixture
@@ -459,6 +500,11 @@ class TestMax(GroupedValueSetterTester):
         setter.set(track, tracks)
         assert track.album == max(tr.album for tr in tracks_group)
 
+    def test_set_batch(self, setter: GroupedValueSetter, tracks: list[LocalTrack], tracks_group: list[LocalTrack]):
+        expected = max(tr.track_number for tr in tracks_group)
+        setter.set_batch(tracks_group, tracks)
+        assert all(tr.track_number == expected for tr in tracks_group)
+
 
 class TestTemplate(SetterTester):
     @pytest.fixture
@@ -499,3 +545,73 @@ class TestTemplate(SetterTester):
 
         setter.set(track, ())
         assert track.title == f"{track.album} - {track.artist} + {track.track_number}"
+
+    def test_set_with_format_spec(self, track: LocalTrack):
+        track.track_number = 7
+        template = "{track_number:03d} - {new_value!r}"
+        fields = {"new_value": TagGetter(field=LocalTrackField.ALBUM)}
+        setter = Template(field=LocalTrackField.TITLE, template=template, fields=fields)
+
+        setter.set(track, ())
+        assert track.title == f"007 - {track.album!r}"
+
+    def test_set_template_shapes(self, track: LocalTrack):
+        setter = Template(field=LocalTrackField.TITLE, template="i am {{constant}}")
+        setter.set(track, ())
+        assert track.title == "i am {constant}"
+
+        setter = Template(field=LocalTrackField.TITLE, template="{album}")
+        setter.set(track, ())
+        assert track.title == track.album
+
+        track.album = None
+        setter.set(track, ())
+        assert track.title == ""
+
+        fields = {"album": TagGetter(field=LocalTrackField.ARTIST)}
+        setter = Template(field=LocalTrackField.TITLE, template="{album}", fields=fields)
+        setter.set(track, ())
+        assert track.title == track.artist
+
+        track.track_number = 7
+        setter = Template(field=LocalTrackField.TITLE, template="{{'{track_number}'}} {album!r}", fields=fields)
+        setter.set(track, ())
+        assert track.title == f"{{'7'}} {track.artist!r}"
+
+        setter = Template(field=LocalTrackField.TITLE, template="{track_number:02d}", fields=fields)
+        setter.set(track, ())
+        assert track.title == "07"
+
+    def test_set_converts_empty_values(self, track: LocalTrack):
+        track.album = None
+
+        setter = Template(field=LocalTrackField.TITLE, template="{album!r}")
+        setter.set(track, ())
+        assert track.title == "''"
+
+        setter = Template(field=LocalTrackField.TITLE, template="{album!r:>4}")
+        setter.set(track, ())
+        assert track.title == "  ''"
+
+    def test_set_after_fields_changed(self, track: LocalTrack):
+        setter = Template(field=LocalTrackField.TITLE, template="{album} - {new_value}", fields={
+            "new_value": TagGetter(field=LocalTrackField.TRACK_NUMBER)
+        })
+        setter.set(track, ())
+        assert track.title == f"{track.album} - {track.track_number}"
+
+        setter.fields = {"new_value": TagGetter(field=LocalTrackField.ARTIST)}
+        setter.set(track, ())
+        assert track.title == f"{track.album} - {track.artist}"
+
+    def test_set_with_escaped_braces(self, track: LocalTrack):
+        setter = Template(field=LocalTrackField.TITLE, template="{{{album}}} - }}{{")
+
+        setter.set(track, ())
+        assert track.title == f"{{{track.album}}} - }}{{"
+
+    def test_init_fails_on_unmatched_braces(self):
+        with pytest.raises(ParserError, match="unmatched braces"):
+            Template(field=LocalTrackField.TITLE, template="{album} - {artist")
+        with pytest.raises(ParserError, match="unmatched braces"):
+            Template(field=LocalTrackField.TITLE, template="{album} } {artist}")
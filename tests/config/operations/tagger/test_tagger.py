@@ -7,7 +7,9 @@ from musify.processors.filter import FilterDefinedList
 
 from musify_cli.config.operations.tagger import FilteredSetter, Tagger
 # noinspection PyProtectedMember
-from musify_cli.config.operations.tagger._setter import Setter, Value
+from musify_cli.config.operations.tagger._getter import TagGetter
+# noinspection PyProtectedMember
+from musify_cli.config.operations.tagger._setter import Setter, Value, Max, Template
 from tests.utils import random_tracks
 
 
@@ -53,3 +55,40 @@ class TestTagger:
                     assert track[field] == value
                 else:
                     assert track[field] != value
+
+    def test_set_values_uses_tags_set_by_previous_rules(self):
+        tracks = random_tracks(5)
+        for track in tracks:
+            track.title = "old"
+
+        getter = TagGetter(LocalTrackField.TITLE)
+        tagger = Tagger(rules=[
+            FilteredSetter(setters=[
+                Template(field=LocalTrackField.ALBUM, template="{t}", fields={"t": getter})
+            ]),
+            FilteredSetter(setters=[Value(field=LocalTrackField.TITLE, value="new")]),
+            FilteredSetter(setters=[
+                Template(field=LocalTrackField.ARTIST, template="{t}", fields={"t": getter})
+            ]),
+        ])
+        tagger.set_tags(tracks, [tracks])
+
+        for track in tracks:
+            assert track.album == "old"
+            assert track.title == "new"
+            assert track.artist == "new"
+
+    def test_set_values_from_collections(self):
+        collections = [random_tracks(10), random_tracks(15)]
+        for i, collection in enumerate(collections, 1):
+            for track in collection:
+                track.album = "i am an album name"
+                track.disc_number = i
+
+        setter = Max(field=LocalTrackField.DISC_NUMBER, group_by=LocalTrackField.ALBUM)
+        tagger = Tagger(rules=[FilteredSetter(filter=None, setters=[setter])])
+        tagger.set_tags([track for collection in collections for track in collection], collections)
+
+        # each track is only grouped with the other tracks in the collection it belongs to
+        for i, collection in enumerate(collections, 1):
+            assert all(track.disc_number == i for track in collection)
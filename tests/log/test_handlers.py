@@ -7,7 +7,8 @@ from random import choice
 import pytest
 
 from musify_cli.log import LOGGING_DT_FORMAT
-from musify_cli.log.handlers import CurrentTimeRotatingFileHandler
+# noinspection PyProtectedMember
+from musify_cli.log.handlers import CurrentTimeRotatingFileHandler, _parse_log_dt
 from tests.utils import random_str
 
 
@@ -37,6 +38,17 @@ def test_current_time_file_handler_namer(tmp_path: Path):
     assert handler.filename.parts == tuple(p for p in base_parts if p)
 
 
+def test_parse_log_dt():
+    dt = datetime(2024, 2, 29, 13, 5, 9)
+    assert _parse_log_dt(dt.strftime(LOGGING_DT_FORMAT)) == dt
+
+    # falls back to strptime for values which do not match the fixed width format
+    assert _parse_log_dt("2024-2-9_13.05.09") == datetime.strptime("2024-2-9_13.05.09", LOGGING_DT_FORMAT)
+
+    for value in ("2024-13-29_13.05.09", "2024-02-29T13.05.09", "2024-02-2a_13.05.09", "not a date", ""):
+        assert _parse_log_dt(value) is None
+
+
 @pytest.fixture
 def log_paths(tmp_path: Path) -> list[Path]:
     """Generate a set of log files and return their paths"""
@@ -83,6 +95,18 @@ def test_current_time_file_handler_rotator_combined(log_paths: list[str], tmp_pa
     assert len(list(tmp_path.glob("*"))) <= 3
 
 
+def test_current_time_file_handler_rotator_no_policy(log_paths: list[str], tmp_path: Path):
+    empty_folder = tmp_path.joinpath("empty")
+    empty_folder.mkdir()
+
+    filename = tmp_path.joinpath("{}.log")
+    handler = CurrentTimeRotatingFileHandler(filename=filename, delay=True)
+
+    assert not handler.removed
+    assert not empty_folder.exists()  # empty folders are always removed
+    assert sorted(tmp_path.glob("*")) == sorted(log_paths)
+
+
 def test_current_time_file_handler_rotator_folders(tmp_path: Path):
     dt_now = datetime.now()
 
@@ -105,3 +129,26 @@ def test_current_time_file_handler_rotator_folders(tmp_path: Path):
     for path in tmp_path.glob("*"):
         dt = datetime.strptime(path.name, LOGGING_DT_FORMAT)
         assert dt >= handler.dt - timedelta(hours=10)  # deleted all empty folders >10hrs
+
+
+def test_current_time_file_handler_rotator_ignores_sibling_folders(tmp_path: Path):
+    dt_now = datetime.now()
+
+    backup_root = tmp_path.joinpath("backup")
+    paths = []
+    for days in (40, 30, 1):
+        path = backup_root.joinpath((dt_now - timedelta(days=days)).strftime(LOGGING_DT_FORMAT))
+        paths.append(path)
+        path.mkdir(parents=True)
+        path.joinpath(random_str() + ".txt").write_text(random_str())
+
+    handler = CurrentTimeRotatingFileHandler(
+        filename=tmp_path.joinpath("logs", "{}.log"), dt=dt_now, when="d", interval=7, delay=True
+    )
+
+    # the placeholder is in a sub-folder of the rotated folder, siblings never match it and are not too old
+    backup_path = backup_root.joinpath(dt_now.strftime(LOGGING_DT_FORMAT))
+    handler.rotator(str(backup_path.joinpath("{}")), backup_path)
+
+    assert not handler.removed
+    assert sorted(backup_root.glob("*")) == sorted(paths)
@@ -1,12 +1,16 @@
 from abc import ABCMeta
+from copy import deepcopy
 from datetime import timedelta
 from pathlib import Path
+from typing import Any
 
 import pytest
 from musify.field import TagFields
 from musify.libraries.remote.core.library import RemoteLibrary
 from musify.libraries.remote.spotify import SOURCE_NAME as SPOTIFY_SOURCE
 from musify.libraries.remote.spotify.library import SpotifyLibrary
+from pytest_mock import MockerFixture
+from yarl import URL
 
 from tests.mocks.remote import RemotePlaylistMock, RemoteTrackMock, RemoteLibraryMock, RemoteAlbumMock, \
     RemoteArtistMock, SpotifyLibraryMock, SpotifyPlaylistMock, SpotifyAlbumMock, SpotifyTrackMock, SpotifyArtistMock
@@ -16,6 +20,7 @@ from musify_cli.config.library.remote import RemoteLibraryConfig, SpotifyAPIConf
 from musify_cli.config.library.types import LoadTypesRemote, EnrichTypesRemote
 from musify_cli.manager.library import RemoteLibraryManager
 from tests.manager.library.testers import LibraryManagerTester
+from tests.utils import random_str
 
 
 class RemoteLibraryManagerTester[L: RemoteLibrary, C: RemoteLibraryConfig](
@@ -277,3 +282,102 @@ class TestSpotifyLibraryManager(RemoteLibraryManagerTester[SpotifyLibrary, Spoti
         enriched_types_artist = manager_mock.types_enriched[LoadTypesRemote.SAVED_ARTISTS]
         assert not enriched_types_artist
         assert not library.enrich_saved_artists_args["tracks"]
+
+    @staticmethod
+    def _get_album_response(url: str, total: int, limit: int) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+        """Generate an album response with only the first page of ``limit`` tracks and all ``total`` tracks."""
+        album_id = random_str(22, 22)
+        tracks = []
+        for i in range(total):
+            track_id = random_str(22, 22)
+            tracks.append({
+                "id": track_id,
+                "uri": f"spotify:track:{track_id}",
+                "href": f"{url}/tracks/{track_id}",
+                "type": "track",
+                "name": f"track {i}",
+                "external_urls": {},
+                "artists": [],
+                "duration_ms": 1000,
+                "track_number": i + 1,
+                "disc_number": 1,
+                "is_local": False,
+                "explicit": False,
+            })
+
+        tracks_href = f"{url}/albums/{album_id}/tracks"
+        response = {
+            "id": album_id,
+            "uri": f"spotify:album:{album_id}",
+            "href": f"{url}/albums/{album_id}",
+            "type": "album",
+            "album_type": "album",
+            "name": f"album {album_id}",
+            "external_urls": {},
+            "artists": [],
+            "genres": [],
+            "images": [],
+            "release_date": "2024-01-01",
+            "release_date_precision": "day",
+            "total_tracks": total,
+            "tracks": {
+                "href": f"{tracks_href}?offset=0&limit={limit}",
+                "items": tracks[:limit],
+                "limit": limit,
+                "next": f"{tracks_href}?offset={limit}&limit={limit}" if total > limit else None,
+                "offset": 0,
+                "previous": None,
+                "total": total,
+            },
+        }
+        return response, tracks
+
+    async def test_extend_albums(
+            self, manager_mock: RemoteLibraryManager[SpotifyLibrary, SpotifyLibraryConfig], mocker: MockerFixture
+    ):
+        url = str(manager_mock.api.url)
+        limit = 2
+        responses = {}
+        all_tracks = {}
+        for total in (1, 3, 5, 8):
+            response, tracks = self._get_album_response(url, total=total, limit=limit)
+            responses[response["id"]] = response
+            all_tracks[response["id"]] = tracks
+
+        async def request(method: str, url: str | URL, params: dict[str, Any] | None = None, **__) -> dict[str, Any]:
+            """Return the stored album responses or pages of tracks for the requested ``url``."""
+            assert method == "GET"
+            url = URL(url)
+            params = dict(url.query) | (params or {})
+            if url.name == "albums":
+                return {"albums": [deepcopy(responses[id_]) for id_ in params["ids"].split(",")]}
+
+            album_id = url.parent.name
+            offset = int(params.get("offset", 0))
+            page_limit = int(params.get("limit", limit))
+            tracks = all_tracks[album_id]
+            next_offset = offset + page_limit
+
+            return {
+                "href": str(url),
+                "items": deepcopy(tracks[offset:next_offset]),
+                "limit": page_limit,
+                "next": str(url % {"offset": next_offset}) if next_offset < len(tracks) else None,
+                "offset": offset,
+                "previous": None,
+                "total": len(tracks),
+            }
+
+        # handler uses slots so patch the method on its class
+        mocker.patch.object(type(manager_mock.api.handler), "request", side_effect=request)
+
+        albums = [self.album_mock(deepcopy(response)) for response in responses.values()]
+        assert any(len(album.tracks) < album.track_total for album in albums)
+
+        await manager_mock._extend_albums(albums)
+
+        for album in albums:
+            expected = [track["uri"] for track in all_tracks[album.id]]
+            assert len(album.tracks) == album.track_total
+            assert [track.uri for track in album.tracks] == expected
+            assert len(album.response["tracks"]["items"]) == album.track_total
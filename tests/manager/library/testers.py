@@ -4,8 +4,9 @@ from random import shuffle, sample
 
 import pytest
 from musify.types import MusifyEnum
+from pytest_mock import MockerFixture
 
-from mocks.local import LocalLibraryMock
+from tests.mocks.local import LocalLibraryMock
 from musify_cli.config.library import LibraryConfig
 # noinspection PyProtectedMember
 from musify_cli.manager.library._core import LibraryManager
@@ -66,9 +67,26 @@ class LibraryManagerTester[T: LibraryManager[LocalLibraryMock, LibraryConfig]](A
         pass  # TODO
 
     @staticmethod
-    @pytest.mark.skip(reason="Test not yet implemented")
-    async def test_get_available_backup_groups(manager_mock: T):
-        pass  # TODO
+    async def test_get_available_backup_groups(manager_mock: T, tmp_path: Path, mocker: MockerFixture):
+        # the library name may depend on remote user data, only the folder discovery logic is tested here
+        mocker.patch.object(manager_mock, "_get_library_backup_name", return_value="Library - name")
+        backup_folder = tmp_path.joinpath("backup")
+        backup_name = "[KEY] - Library - name"
+
+        for group in ("2024-03-01", "2024-01-01", "2024-02-01"):
+            backup_folder.joinpath(group).mkdir(parents=True)
+            backup_folder.joinpath(group, backup_name + ".json").touch()
+
+        backup_folder.joinpath("2024-04-01").mkdir()  # no backups
+        backup_folder.joinpath("2024-05-01").mkdir()  # backups for other libraries only
+        backup_folder.joinpath("2024-05-01", "[KEY] - Other - other.json").touch()
+        backup_folder.joinpath("2024-06-01", "nested").mkdir(parents=True)  # backups only in a nested folder
+        backup_folder.joinpath("2024-06-01", "nested", backup_name + ".json").touch()
+        backup_folder.joinpath(backup_name + ".json").touch()  # current run's data in the root folder
+
+        # only groups directly in the backup folder are returned, sorted by name
+        groups = manager_mock._get_available_backup_groups(backup_folder)
+        assert groups == ["2024-01-01", "2024-02-01", "2024-03-01"]
 
     @staticmethod
     @pytest.mark.skip(reason="Test not yet implemented")